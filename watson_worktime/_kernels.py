@@ -0,0 +1,24 @@
+"""Optional compiled kernels for the frame aggregation.
+
+Numba is not a hard dependency; importers should fall back to the plain
+numpy implementation when ``bucket_durations`` is None.
+"""
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    bucket_durations = None
+else:
+
+    @njit(cache=True, nogil=True)
+    def bucket_durations(day_indices, durations, first_day):
+        """Sums frame durations into one bucket per day.
+
+        Returns a dense array of seconds covering the days from first_day up
+        to the last day that occurs in day_indices.
+        """
+        n_days = int(day_indices.max()) - first_day + 1
+        out = np.zeros(n_days, dtype=np.float64)
+        for i in range(day_indices.shape[0]):
+            out[day_indices[i] - first_day] += durations[i]
+        return out
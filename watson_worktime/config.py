@@ -1,15 +1,24 @@
 import copy
 import datetime
+import functools
+import os
+import pickle
 import tomllib
+from collections.abc import Iterable
 from enum import StrEnum
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
-import holidays
-from holidays.holiday_base import HolidayBase
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
 
 from .data import watson_dir, Weekday
 
+if TYPE_CHECKING:
+    from holidays.holiday_base import HolidayBase
+
 
 DEFAULT_CONFIG = {
     "country": "DE",
@@ -21,6 +30,28 @@ DEFAULT_CONFIG = {
     "day-list": "full",
 }
 
+_WEEKDAY_BY_NAME = {weekday.name.lower(): weekday for weekday in Weekday}
+
+CACHE_FILE = ".worktime.cache.pickle"
+SOURCE_FILES = ("worktime.toml", "vacation-days", "ignored-days")
+
+
+def _stat_key(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _country_holidays(country: str, subdiv: Optional[str]) -> "HolidayBase":
+    # holidays is expensive to import, so only pay for it when a holiday
+    # calendar is actually needed.
+    import holidays
+
+    return holidays.country_holidays(country, subdiv=subdiv)
+
 
 class DayListStyle(StrEnum):
     FULL = "full"
@@ -29,50 +60,108 @@ class DayListStyle(StrEnum):
 
 
 def load_days(path: Path) -> set[datetime.date]:
-    result = set()
     try:
-        with open(path, "r", encoding="utf-8") as reader:
-            for line in reader:
-                day = datetime.date.fromisoformat(line.strip())
-                result.add(day)
+        text = path.read_text(encoding="utf-8")
     except FileNotFoundError:
-        pass
-    return result
+        return set()
+    return {datetime.date.fromisoformat(line) for line in text.splitlines() if line}
 
 
 def save_days(path: Path, days: set[datetime.date]):
-    sorted_days = list(days)
-    sorted_days.sort()
-    path.write_text("\n".join(day.isoformat() for day in sorted_days))
+    data = b"\n".join(day.isoformat().encode("ascii") for day in sorted(days))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
 
 
 class Config:
+    __slots__ = (
+        "data",
+        "vacation_days",
+        "ignored_days",
+        "_workdays",
+        "_saved_vacation",
+        "_saved_ignored",
+        "_off_days",
+        "_worktime_per_day",
+    )
+
     def __init__(self):
         self.data = copy.copy(DEFAULT_CONFIG)
         self.vacation_days = set()
         self.ignored_days = set()
+        self._workdays: Optional[list[Weekday]] = None
+        self._off_days: Optional[frozenset[datetime.date]] = None
+        self._worktime_per_day: Optional[datetime.timedelta] = None
+        self._saved_vacation: set[datetime.date] = set()
+        self._saved_ignored: set[datetime.date] = set()
 
     def load(self):
-        self._load_config()
-        self.vacation_days = load_days(watson_dir() / "vacation-days")
-        self.ignored_days = load_days(watson_dir() / "ignored-days")
+        if not self._load_cached():
+            self._load_config()
+            self.vacation_days = load_days(watson_dir() / "vacation-days")
+            self.ignored_days = load_days(watson_dir() / "ignored-days")
+            self._write_cache()
+        # Snapshots of the on-disk state, so save() can skip unchanged files.
+        self._saved_vacation = set(self.vacation_days)
+        self._saved_ignored = set(self.ignored_days)
+
+    def _source_key(self) -> tuple:
+        base = watson_dir()
+        return tuple(_stat_key(base / name) for name in SOURCE_FILES)
+
+    def _load_cached(self) -> bool:
+        """Loads the pickled snapshot, if it is still up to date."""
+        try:
+            with open(watson_dir() / CACHE_FILE, "rb") as reader:
+                key, state = pickle.load(reader)
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            return False
+        if key != self._source_key():
+            return False
+        self.data, self.vacation_days, self.ignored_days = state
+        return True
+
+    def _write_cache(self):
+        state = (self.data, self.vacation_days, self.ignored_days)
+        try:
+            with open(watson_dir() / CACHE_FILE, "wb") as writer:
+                pickle.dump((self._source_key(), state), writer)
+        except OSError:
+            pass
 
     def _load_config(self):
         path = watson_dir() / "worktime.toml"
         try:
-            with open(path, "rb") as reader:
-                data = tomllib.load(reader)
+            if rtoml is not None:
+                data = rtoml.load(path)
+            else:
+                with open(path, "rb") as reader:
+                    data = tomllib.load(reader)
         except FileNotFoundError:
             pass
         else:
             self.data.update(data)
 
     def save(self):
-        save_days(watson_dir() / "vacation-days", self.vacation())
-        save_days(watson_dir() / "ignored-days", self.ignored())
+        changed = False
+        if self.vacation_days != self._saved_vacation:
+            save_days(watson_dir() / "vacation-days", self.vacation())
+            self._saved_vacation = set(self.vacation_days)
+            changed = True
+        if self.ignored_days != self._saved_ignored:
+            save_days(watson_dir() / "ignored-days", self.ignored())
+            self._saved_ignored = set(self.ignored_days)
+            changed = True
+        if changed:
+            (watson_dir() / CACHE_FILE).unlink(missing_ok=True)
 
     def worktime_per_day(self) -> datetime.timedelta:
-        return datetime.timedelta(hours=self.data["hours-per-day"])
+        if self._worktime_per_day is None:
+            self._worktime_per_day = datetime.timedelta(hours=self.data["hours-per-day"])
+        return self._worktime_per_day
 
     def country(self) -> str:
         return self.data["country"]
@@ -80,29 +169,59 @@ class Config:
     def subdiv(self) -> Optional[str]:
         return self.data["state"]
 
-    def holidays(self) -> HolidayBase:
-        return holidays.country_holidays(self.country(), subdiv=self.subdiv())
+    def holidays(self) -> "HolidayBase":
+        return _country_holidays(self.country(), self.subdiv())
+
+    def off_days(self) -> frozenset[datetime.date]:
+        """All days that are taken off regardless of weekday.
+
+        Holidays are not part of this set, as the holiday calendar populates
+        its years lazily on membership tests and can therefore not be
+        snapshotted up front.
+        """
+        if self._off_days is None:
+            self._off_days = frozenset(self.vacation_days | self.ignored_days)
+        return self._off_days
 
     def vacation(self) -> set[datetime.date]:
         return self.vacation_days
 
     def add_vacation(self, day: datetime.date):
         self.vacation_days.add(day)
+        self._off_days = None
 
     def remove_vacation(self, day: datetime.date):
         self.vacation_days.remove(day)
+        self._off_days = None
+
+    def add_vacations(self, days: Iterable[datetime.date]):
+        self.vacation_days |= set(days)
+        self._off_days = None
+
+    def remove_vacations(self, days: Iterable[datetime.date]):
+        """Removes the given vacation days, ignoring unknown ones."""
+        self.vacation_days -= set(days)
+        self._off_days = None
 
     def ignored(self) -> set[datetime.date]:
         return self.ignored_days
 
     def add_ignored(self, day: datetime.date):
         self.ignored_days.add(day)
+        self._off_days = None
 
     def remove_ignored(self, day: datetime.date):
         self.ignored_days.remove(day)
+        self._off_days = None
 
     def workdays(self) -> list[Weekday]:
-        return [Weekday.from_str(value) for value in self.data["workdays"]]
+        if self._workdays is None:
+            # Full names hit the dict; abbreviations fall back to the prefix scan.
+            self._workdays = [
+                _WEEKDAY_BY_NAME.get(value.lower()) or Weekday.from_str(value)
+                for value in self.data["workdays"]
+            ]
+        return self._workdays
 
     def inception(self) -> Optional[datetime.date]:
         if "inception" in self.data:
@@ -1,16 +1,43 @@
 import datetime
-import re
-from collections.abc import Iterator
+import sys
+from bisect import bisect_left
 from collections import deque
 from typing import Optional
 
 import click
 
 from .config import Config, DayListStyle
-from .data import load_frames, Day, Calendar, Weekday
+from .data import load_timestamps, window_timestamps, Day, Calendar, Weekday
 
 DEFAULT_PERIOD = datetime.timedelta(days=7)
 SECS_PER_HOUR = 60 * 60
+ZERO_TD = datetime.timedelta(0)
+
+_PERIOD_SUFFIXES = [("days", 1), ("d", 1), ("weeks", 7), ("w", 7)]
+
+_DOW = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Pre-built ANSI sequences for the fixed styles used in the day list, so that
+# the hot loop does not have to go through click.style for every line.  When
+# stdout is not a terminal the sequences are empty, matching click's own
+# auto-detection.
+_ISATTY = sys.stdout.isatty()
+_CYAN = "\x1b[36m" if _ISATTY else ""
+_CYAN_BOLD = "\x1b[1;36m" if _ISATTY else ""
+_GREEN = "\x1b[32m" if _ISATTY else ""
+_YELLOW = "\x1b[33m" if _ISATTY else ""
+_RED = "\x1b[31m" if _ISATTY else ""
+_GRAY_LIGHT = "\x1b[38;2;180;180;180m" if _ISATTY else ""
+_GRAY_DARK = "\x1b[38;2;150;150;150m" if _ISATTY else ""
+_RESET = "\x1b[0m" if _ISATTY else ""
+
+if _ISATTY:
+    _style = click.style
+else:
+    # Piped output gets its codes stripped by click anyway, so skip building
+    # the styled strings in the first place.
+    def _style(text, **_kwargs):
+        return text
 
 
 def print_total_compact(total: datetime.timedelta):
@@ -27,12 +54,10 @@ def print_total_compact(total: datetime.timedelta):
 
 
 def print_total_exact(total: datetime.timedelta, hours_per_day: datetime.timedelta):
-    full_workdays = 0
-    remainder = abs(total)
+    if not hours_per_day:
+        return f"{abs(total)}"
 
-    while remainder > hours_per_day:
-        remainder -= hours_per_day
-        full_workdays += 1
+    full_workdays, remainder = divmod(abs(total), hours_per_day)
 
     if full_workdays > 0:
         return f"{full_workdays} Workdays and {remainder}"
@@ -54,7 +79,7 @@ class Date(click.ParamType):
         if value is None:
             return None
 
-        if isinstance(value, Date):
+        if isinstance(value, datetime.date):
             return value
 
         return datetime.date.fromisoformat(value)
@@ -67,86 +92,100 @@ class TimeDelta(click.ParamType):
         if value is None:
             return None
 
-        if isinstance(value, TimeDelta):
+        if isinstance(value, datetime.timedelta):
             return value
 
-        matcher = re.compile(
-            r"^(((?P<days>\d+)\s*d(ays)?))|((?P<weeks>\d+)\s*w(eeks)?)$"
-        )
-        match = matcher.match(value)
-
-        if not match:
-            self.fail("Invalid period", param, ctx)
+        text = value.strip().lower()
+        for suffix, factor in _PERIOD_SUFFIXES:
+            if text.endswith(suffix):
+                count = text[: -len(suffix)].strip()
+                if count.isdigit():
+                    return datetime.timedelta(days=int(count) * factor)
+                break
 
-        result = datetime.timedelta()
-        if match.group("days"):
-            result += datetime.timedelta(days=int(match.group("days")))
-        if match.group("weeks"):
-            result += datetime.timedelta(days=7 * int(match.group("weeks")))
-        return result
+        self.fail("Invalid period", param, ctx)
 
 
 class DayList:
+    __slots__ = (
+        "config",
+        "number_to_show",
+        "lastdays",
+        "count",
+        "_vacation",
+        "_ignored",
+        "_lines",
+        "_style",
+    )
+
     def __init__(self, config: Config, number_to_show: int = 5):
         self.config = config
         self.number_to_show = number_to_show
-        self.lastdays: deque[Day] = deque(maxlen=number_to_show)
+        self.lastdays: deque[tuple[Day, datetime.timedelta]] = deque(maxlen=number_to_show)
         self.count = 0
+        self._vacation = config.vacation()
+        self._ignored = config.ignored()
+        self._lines: list[str] = []
+        self._style = config.day_list()
 
-    def _show_day(self, day: Day):
-        echo_name = click.style(day.date.strftime("%a"), fg="cyan")
-        echo_date = click.style(day.date.strftime("%Y-%m-%d"), fg="cyan", bold=True)
-        echo_worktime = click.style(str(day.worktime), fg="green")
-
-        overtime = day.overtime(self.config)
+    def _show_day(self, day: Day, overtime: datetime.timedelta):
+        echo_name = f"{_CYAN}{_DOW[day.date.weekday()]}{_RESET}"
+        echo_date = f"{_CYAN_BOLD}{day.date.isoformat()}{_RESET}"
+        echo_worktime = f"{_GREEN}{day.worktime}{_RESET}"
 
-        if overtime == datetime.timedelta():
+        if overtime == ZERO_TD:
             echo_overtime = "+0"
-        elif overtime > datetime.timedelta():
-            echo_overtime = click.style("+" + str(overtime), fg="yellow")
+        elif overtime > ZERO_TD:
+            echo_overtime = f"{_YELLOW}+{overtime}{_RESET}"
         else:
-            echo_overtime = click.style("-" + str(abs(overtime)), fg="red")
+            echo_overtime = f"{_RED}-{abs(overtime)}{_RESET}"
 
         explanation = ""
-        if day.date in self.config.vacation():
-            explanation = click.style(" (vacation)", fg=(180, 180, 180))
-        elif day.date in self.config.ignored():
-            explanation = click.style(" (ignored)", fg=(150, 150, 150))
+        if day.date in self._vacation:
+            explanation = f"{_GRAY_LIGHT} (vacation){_RESET}"
+        elif day.date in self._ignored:
+            explanation = f"{_GRAY_DARK} (ignored){_RESET}"
 
-        click.echo(f"Day {echo_name} {echo_date}: {echo_worktime} {echo_overtime}{explanation}")
+        self._lines.append(
+            f"Day {echo_name} {echo_date}: {echo_worktime} {echo_overtime}{explanation}"
+        )
 
-    def _insert(self, day: Day):
+    def _insert(self, day: Day, overtime: datetime.timedelta):
         if self.count < self.number_to_show:
-            self._show_day(day)
+            self._show_day(day, overtime)
         else:
-            self.lastdays.append(day)
+            self.lastdays.append((day, overtime))
         self.count += 1
 
     def _show_ellipsis(self):
-        click.echo("⋮   ⋮   ⋮           ⋮       ⋮")
+        self._lines.append("⋮   ⋮   ⋮           ⋮       ⋮")
 
     def _finish_truncated(self):
         if self.count > 2 * self.number_to_show:
             self._show_ellipsis()
 
-        for day in self.lastdays:
-            self._show_day(day)
+        for day, overtime in self.lastdays:
+            self._show_day(day, overtime)
 
     def finish(self):
-        style = self.config.day_list()
+        style = self._style
         if style == DayListStyle.TRUNCATE:
             self._finish_truncated()
         if style != DayListStyle.NONE:
-            click.echo("------")
-
-    def show(self, day: Day):
-        style = self.config.day_list()
+            self._lines.append("------")
+        # A single write for the whole report instead of one per day.
+        if self._lines:
+            click.echo("\n".join(self._lines))
+            self._lines.clear()
+
+    def show(self, day: Day, overtime: datetime.timedelta):
+        style = self._style
         if style == DayListStyle.NONE:
             return
         elif style == DayListStyle.TRUNCATE:
-            self._insert(day)
+            self._insert(day, overtime)
         elif style == DayListStyle.FULL:
-            self._show_day(day)
+            self._show_day(day, overtime)
 
 
 @click.group()
@@ -168,22 +207,25 @@ def vacation_list(ctx: click.Context):
     config: Config = ctx.obj
     days = list(config.vacation())
     days.sort()
-    for day in days:
-        echo_date = click.style(day.strftime("%Y-%m-%d"), fg="cyan", bold=True)
-        click.echo(echo_date)
-
-    current_days = [day for day in days if day.year == datetime.datetime.now().year]
-    click.echo("------")
-    echo_taken = click.style(
-        f"Vacation days taken: {len(current_days)}", fg="green", bold=True
+    lines = [_style(day.isoformat(), fg="cyan", bold=True) for day in days]
+
+    # days is sorted, so the current year is a contiguous slice.
+    year = datetime.date.today().year
+    lo = bisect_left(days, datetime.date(year, 1, 1))
+    hi = bisect_left(days, datetime.date(year + 1, 1, 1))
+    n_current = hi - lo
+    lines.append("------")
+    lines.append(
+        _style(f"Vacation days taken: {n_current}", fg="green", bold=True)
     )
-    echo_remaining = click.style(
-        f"Vacation days remaining: {config.vacation_per_year() - len(current_days)}",
-        fg="yellow",
-        bold=True,
+    lines.append(
+        _style(
+            f"Vacation days remaining: {config.vacation_per_year() - n_current}",
+            fg="yellow",
+            bold=True,
+        )
     )
-    click.echo(echo_taken)
-    click.echo(echo_remaining)
+    click.echo("\n".join(lines))
 
 
 @vacation.command("add")
@@ -199,8 +241,7 @@ def vacation_add(
 ):
     """Adds a vacation day."""
     config: Config = ctx.obj
-    frames = load_frames(include_current=False)
-    calendar = Calendar(frames)
+    calendar = Calendar.from_timestamps(*load_timestamps(include_current=False))
 
     day = list(day)
 
@@ -210,8 +251,7 @@ def vacation_add(
         except ValueError as exc:
             ctx.fail(str(exc))
 
-        for date in iterdays(period_start, period_end):
-            cur_day = calendar[date]
+        for cur_day in calendar.iter_range(period_start, period_end):
             # We use show_day as a heuristic to decide whether we should add
             # the day as a vacation day. This way we automatically ignore
             # holidays and non-work days.
@@ -220,8 +260,7 @@ def vacation_add(
     elif from_ or to:
         ctx.fail("Need both, --from and --to!")
 
-    for vacation_day in day:
-        config.add_vacation(vacation_day)
+    config.add_vacations(day)
     config.save()
 
 
@@ -249,11 +288,7 @@ def vacation_del(
     elif from_ or to:
         ctx.fail("Need both, --from and --to!")
 
-    for vacation_day in day:
-        try:
-            config.remove_vacation(vacation_day)
-        except KeyError:
-            pass
+    config.remove_vacations(day)
     config.save()
 
 
@@ -309,30 +344,32 @@ def report(
 ):
     """Reports the worktime (and overtime) for the given time period."""
     config: Config = ctx.obj
-    frames = load_frames(include_current=current)
-    calendar = Calendar(frames)
 
     try:
         period_start, period_end = get_period(config, from_, to, period, workweek)
     except ValueError as exc:
         ctx.fail(str(exc))
 
-    total_overtime = datetime.timedelta(0)
+    starts, stops = load_timestamps(include_current=current)
+    starts, stops = window_timestamps(starts, stops, period_start, period_end)
+    calendar = Calendar.from_timestamps(starts, stops)
+
+    total_overtime = ZERO_TD
     day_list = DayList(config)
 
-    for date in iterdays(period_start, period_end):
-        day = calendar[date]
+    for day in calendar.iter_range(period_start, period_end):
         if not show_day(day, config):
             continue
 
-        total_overtime += day.overtime(config)
-        day_list.show(day)
+        overtime = day.overtime(config)
+        total_overtime += overtime
+        day_list.show(day, overtime)
     day_list.finish()
 
-    if total_overtime > datetime.timedelta(0):
-        echo_total = click.style("+" + print_total(config, total_overtime), fg="yellow")
+    if total_overtime > ZERO_TD:
+        echo_total = _style("+" + print_total(config, total_overtime), fg="yellow")
     else:
-        echo_total = click.style("-" + print_total(config, total_overtime), fg="red")
+        echo_total = _style("-" + print_total(config, total_overtime), fg="red")
     click.echo(f"Total: {echo_total}")
 
 
@@ -349,9 +386,8 @@ def get_period(
 
         first_dow = config.workdays()[0]
         period_end = datetime.date.today()
-        period_start = period_end
-        while Weekday.from_date(period_start) != first_dow:
-            period_start -= datetime.timedelta(days=1)
+        shift = (period_end.weekday() - first_dow.index()) % 7
+        period_start = period_end - datetime.timedelta(days=shift)
 
     else:
         if from_ is not None and to is not None and period is not None:
@@ -368,11 +404,9 @@ def get_period(
     return (period_start, period_end)
 
 
-def iterdays(start: datetime.date, stop: datetime.date) -> Iterator[datetime.date]:
-    current = start
-    while current <= stop:
-        yield current
-        current += datetime.timedelta(days=1)
+def iterdays(start: datetime.date, stop: datetime.date) -> list[datetime.date]:
+    fromordinal = datetime.date.fromordinal
+    return [fromordinal(ordinal) for ordinal in range(start.toordinal(), stop.toordinal() + 1)]
 
 
 def show_day(day: Day, config: Config) -> bool:
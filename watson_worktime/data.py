@@ -2,8 +2,12 @@
 import datetime
 import json
 import os
+import pickle
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
 from collections import defaultdict
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from enum import StrEnum
 from pathlib import Path
 from typing import NamedTuple, Optional, TYPE_CHECKING
@@ -11,6 +15,19 @@ from typing import NamedTuple, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .config import Config
 
+SECS_PER_DAY = 24 * 60 * 60
+_EPOCH_ORDINAL = datetime.date(1970, 1, 1).toordinal()
+_ZERO_TD = datetime.timedelta(0)
+
+
+def _local_day(ts: float) -> int:
+    """Returns the local-time day number since the epoch for a timestamp."""
+    return (int(ts) + time.localtime(ts).tm_gmtoff) // SECS_PER_DAY
+
+
+def _day_to_date(day: int) -> datetime.date:
+    return datetime.date.fromordinal(day + _EPOCH_ORDINAL)
+
 
 class Weekday(StrEnum):
     MONDAY = "mo"
@@ -23,7 +40,11 @@ class Weekday(StrEnum):
 
     @classmethod
     def from_date(cls, date: datetime.date) -> "Weekday":
-        return list(cls)[date.weekday()]
+        return _WEEKDAYS[date.weekday()]
+
+    def index(self) -> int:
+        """Returns the weekday number, compatible with date.weekday()."""
+        return _WEEKDAYS.index(self)
 
     @classmethod
     def from_str(cls, value: str) -> "Weekday":
@@ -32,6 +53,9 @@ class Weekday(StrEnum):
                 return weekday
 
 
+_WEEKDAYS = tuple(Weekday)
+
+
 def watson_dir() -> Path:
     """Retrieves the watson directory in effect."""
     watson_dir = os.getenv("WATSON_DIR")
@@ -40,11 +64,23 @@ def watson_dir() -> Path:
     return Path.home() / ".config" / "watson"
 
 
+def _load_json(path: Path):
+    """Parses a JSON file, with orjson when available."""
+    with open(path, "rb") as jsonfile:
+        raw = jsonfile.read()
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(raw)
+    return orjson.loads(raw)
+
+
 def clamp(dt: datetime.datetime, date: datetime.date) -> datetime.datetime:
-    if dt.date() < date:
-        return datetime.datetime.combine(date, datetime.time.min)
-    if dt.date() > date:
-        return datetime.datetime.combine(date, datetime.time.max)
+    day = dt.date()
+    if day < date:
+        return datetime.datetime(date.year, date.month, date.day)
+    if day > date:
+        return datetime.datetime(date.year, date.month, date.day, 23, 59, 59, 999999)
     return dt
 
 
@@ -56,19 +92,21 @@ class Frame(NamedTuple):
         """Returns the portion of the frame that lies on the given day."""
         return clamp(self.stop, date) - clamp(self.start, date)
 
+    def iter_dates(self) -> Iterator[datetime.date]:
+        """Yields the dates that this frame entails."""
+        current = self.start.date()
+        stop = self.stop.date()
+        while current <= stop:
+            yield current
+            current += datetime.timedelta(days=1)
+
     def dates(self) -> list[datetime.date]:
         """Returns a list of dates that this frame entails."""
-        def _generate():
-            current = self.start.date()
-            while current <= self.stop.date():
-                yield current
-                current += datetime.timedelta(days=1)
-        return list(_generate())
+        return list(self.iter_dates())
 
 
 def load_frames(include_current=False) -> list[Frame]:
-    with open(watson_dir() / "frames") as framefile:
-        data = json.load(framefile)
+    data = _load_json(watson_dir() / "frames")
     frames = [
         Frame(
             start=datetime.datetime.fromtimestamp(row[0]),
@@ -78,8 +116,7 @@ def load_frames(include_current=False) -> list[Frame]:
     ]
     if include_current:
         try:
-            with open(watson_dir() / "state") as statefile:
-                data = json.load(statefile)
+            data = _load_json(watson_dir() / "state")
             data["start"]
         except (FileNotFoundError, KeyError):
             pass
@@ -92,6 +129,104 @@ def load_frames(include_current=False) -> list[Frame]:
     return frames
 
 
+def _cache_dir() -> Path:
+    cache_home = os.getenv("XDG_CACHE_HOME")
+    base = Path(cache_home) if cache_home else Path.home() / ".cache"
+    return base / "watson-worktime"
+
+
+def _load_frame_timestamps() -> tuple[list[float], list[float]]:
+    """Loads the timestamps of the frames file, cached by mtime and size."""
+    path = watson_dir() / "frames"
+    try:
+        stat = path.stat()
+        key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+    cache_path = _cache_dir() / "frames.pickle"
+    if key is not None:
+        try:
+            with open(cache_path, "rb") as reader:
+                cached_key, starts, stops = pickle.load(reader)
+            if cached_key == key:
+                return starts, stops
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            pass
+    data = _load_json(path)
+    starts = [row[0] for row in data]
+    stops = [row[1] for row in data]
+    if key is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent)
+            with os.fdopen(fd, "wb") as writer:
+                pickle.dump((key, starts, stops), writer)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return starts, stops
+
+
+def load_timestamps(include_current=False) -> tuple[list[float], list[float]]:
+    """Loads the raw frame start/stop timestamps as epoch seconds."""
+    starts, stops = _load_frame_timestamps()
+    if include_current:
+        try:
+            state = _load_json(watson_dir() / "state")
+            state["start"]
+        except (FileNotFoundError, KeyError):
+            pass
+        else:
+            starts.append(state["start"])
+            stops.append(datetime.datetime.now().replace(microsecond=0).timestamp())
+    return starts, stops
+
+
+def _is_sorted(values: list[float]) -> bool:
+    return all(a <= b for a, b in zip(values, values[1:]))
+
+
+def window_timestamps(
+    starts: list[float],
+    stops: list[float],
+    start: datetime.date,
+    stop: datetime.date,
+) -> tuple[list[float], list[float]]:
+    """Narrows the frame lists to those that can overlap the given dates.
+
+    Watson appends frames chronologically, so both lists are normally
+    sorted and the relevant frames form a contiguous slice.  If the lists
+    turn out not to be sorted, they are returned unchanged.
+    """
+    if not _is_sorted(starts) or not _is_sorted(stops):
+        return starts, stops
+    window_start = datetime.datetime.combine(start, datetime.time.min).timestamp()
+    window_stop = datetime.datetime.combine(
+        stop + datetime.timedelta(days=1), datetime.time.min
+    ).timestamp()
+    lo = bisect_left(stops, window_start)
+    hi = bisect_right(starts, window_stop)
+    return starts[lo:hi], stops[lo:hi]
+
+
+def _bucket_frame(seconds: dict[datetime.date, float], start: float, stop: float):
+    """Adds the duration of a single frame to the per-day accumulator."""
+    current = _local_day(start)
+    last = _local_day(stop)
+    cursor = start
+    while current < last:
+        # The exact local-midnight timestamp, DST transitions included.
+        midnight = datetime.datetime.combine(
+            _day_to_date(current + 1), datetime.time.min
+        ).timestamp()
+        date = _day_to_date(current)
+        seconds[date] = seconds.get(date, 0.0) + (midnight - cursor)
+        cursor = midnight
+        current += 1
+    date = _day_to_date(last)
+    seconds[date] = seconds.get(date, 0.0) + (stop - cursor)
+
+
 class Day:
     """Summary for a day."""
 
@@ -104,17 +239,17 @@ class Day:
         self.worktime += frame.duration_on(self.date)
 
     def expected_worktime(self, config: "Config") -> datetime.timedelta:
-        if self.date in config.holidays() or self.date in (config.vacation() | config.ignored()):
-            return datetime.timedelta(0)
+        if self.date in config.holidays() or self.date in config.off_days():
+            return _ZERO_TD
         if Weekday.from_date(self.date) in config.workdays():
             return config.worktime_per_day()
-        return datetime.timedelta(0)
+        return _ZERO_TD
 
     def overtime(self, config: "Config") -> datetime.timedelta:
         if self.date in config.ignored():
             # The convention is to just ignore everything on ignored days, even
             # if additional work has been done.
-            return datetime.timedelta(0)
+            return _ZERO_TD
         return self.worktime - self.expected_worktime(config)
 
     def get_date(self):
@@ -122,16 +257,90 @@ class Day:
 
 class Calendar:
     def __init__(self, frames: Optional[Iterable[Frame]] = None):
-        self.days: dict[datetime.date, Day] = {}
+        # Only the aggregated seconds are kept per day; Day objects are
+        # materialized on access.
+        self._seconds: dict[datetime.date, float] = {}
         for frame in frames or []:
             self.insert(frame)
 
     def insert(self, frame: Frame):
-        for date in frame.dates():
-            self.days.setdefault(date, Day(date)).insert(frame)
+        _bucket_frame(self._seconds, frame.start.timestamp(), frame.stop.timestamp())
+
+    @classmethod
+    def from_timestamps(cls, starts: list[float], stops: list[float]) -> "Calendar":
+        """Builds a calendar directly from raw frame timestamps.
+
+        This skips the per-frame Frame/datetime object construction and, when
+        numpy is available, sums the common single-day frames in one
+        vectorized pass.
+        """
+        calendar = cls()
+        seconds = calendar._seconds
+        # The accelerators are imported lazily so that commands that never
+        # aggregate frames do not pay their import cost.
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        if np is not None and starts:
+            starts_arr = np.asarray(starts, dtype=np.float64)
+            stops_arr = np.asarray(stops, dtype=np.float64)
+            # The local day of a timestamp is (ts + utcoffset) // SECS_PER_DAY.
+            # Frames whose day assignment is the same under both the standard
+            # and the DST offset do not depend on which one is in effect and
+            # can be bucketed without consulting the timezone database.
+            offsets = (-time.timezone, -time.altzone)
+            start_days = [(starts_arr + offset) // SECS_PER_DAY for offset in offsets]
+            stop_days = [(stops_arr + offset) // SECS_PER_DAY for offset in offsets]
+            fast = (
+                (start_days[0] == start_days[1])
+                & (stop_days[0] == stop_days[1])
+                & (start_days[0] == stop_days[0])
+            )
+            day_indices = start_days[0][fast].astype(np.int64)
+            durations = (stops_arr - starts_arr)[fast]
+            try:
+                from ._kernels import bucket_durations
+            except ImportError:
+                bucket_durations = None
+            if bucket_durations is not None and len(day_indices):
+                first_day = int(day_indices.min())
+                sums = bucket_durations(day_indices, durations, first_day)
+                for offset, total in enumerate(sums.tolist()):
+                    if total:
+                        seconds[_day_to_date(first_day + offset)] = total
+            else:
+                unique_days, inverse = np.unique(day_indices, return_inverse=True)
+                sums = np.zeros(len(unique_days))
+                np.add.at(sums, inverse, durations)
+                for day, total in zip(unique_days.tolist(), sums.tolist()):
+                    seconds[_day_to_date(day)] = total
+            # Day-spanning frames and frames close to a DST-ambiguous midnight
+            # take the exact (slow) path.
+            for index in np.flatnonzero(~fast).tolist():
+                _bucket_frame(seconds, starts[index], stops[index])
+        else:
+            for start, stop in zip(starts, stops):
+                _bucket_frame(seconds, start, stop)
+        return calendar
 
     def __getitem__(self, key):
-        return self.days.get(key, Day(key))
+        secs = self._seconds.get(key)
+        if secs is None:
+            return Day(key)
+        return Day(key, datetime.timedelta(seconds=secs))
+
+    def iter_range(self, start: datetime.date, stop: datetime.date) -> Iterator[Day]:
+        """Yields a Day for every date between start and stop (inclusive)."""
+        seconds = self._seconds
+        fromordinal = datetime.date.fromordinal
+        for ordinal in range(start.toordinal(), stop.toordinal() + 1):
+            date = fromordinal(ordinal)
+            secs = seconds.get(date)
+            if secs is None:
+                yield Day(date)
+            else:
+                yield Day(date, datetime.timedelta(seconds=secs))
 
 
 __all__ = ["watson_dir", "Frame", "load_frames", "Calendar"]